@@ -17,7 +17,9 @@
 
 import asyncio
 import concurrent.futures
+import functools
 import logging
+import os
 import traceback
 import typing
 
@@ -63,6 +65,22 @@ class _ClientDispatcher(Dispatcher):
         self._impl._process_telegram_signaling_message(signaling)
 
 
+@functools.lru_cache()
+def _get_default_blocking_executor() -> concurrent.futures.Executor:
+    if (max_workers_override := os.environ.get("LL_MTPROTO_BLOCKING_EXECUTOR_WORKERS", None)) is not None:
+        try:
+            max_workers = int(max_workers_override)
+        except ValueError:
+            raise RuntimeError(f"LL_MTPROTO_BLOCKING_EXECUTOR_WORKERS must be a positive integer, found `{max_workers_override!r}`") from None
+
+        if max_workers < 1:
+            raise RuntimeError(f"LL_MTPROTO_BLOCKING_EXECUTOR_WORKERS must be a positive integer, found `{max_workers_override!r}`")
+    else:
+        max_workers = min(4, os.cpu_count() or 1)
+
+    return concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ll_mtproto")
+
+
 class _ClientInThreadImpl(InThread):
     __slots__ = ("_blocking_executor",)
 
@@ -131,7 +149,7 @@ class Client:
             auth_key: AuthKey,
             connection_info: ConnectionInfo,
             transport_link_factory: TransportLinkFactory,
-            blocking_executor: concurrent.futures.Executor,
+            blocking_executor: concurrent.futures.Executor | None,
             crypto_provider: CryptoProviderBase,
             no_updates: bool = True,
             use_perfect_forward_secrecy: bool = False,
@@ -144,6 +162,9 @@ class Client:
         self._crypto_provider = crypto_provider
         self._error_description_resolver = error_description_resolver
 
+        if blocking_executor is None:
+            blocking_executor = _get_default_blocking_executor()
+
         self._in_thread = _ClientInThreadImpl(blocking_executor)
 
         rpc_error_constructor = datacenter.schema.constructors.get("rpc_error", None)
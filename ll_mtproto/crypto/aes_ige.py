@@ -17,7 +17,7 @@
 
 from ll_mtproto.crypto.providers.crypto_provider_base import CryptoProviderBase
 from ll_mtproto.tl.byteutils import short_hex, sha1
-from ll_mtproto.typed import InThread, PartialByteReader
+from ll_mtproto.typed import InThread, PartialByteReader, ByteConsumer
 
 __all__ = ("AesIge", "AesIgeAsyncStream")
 
@@ -47,8 +47,10 @@ class AesIge:
         return self._crypto_provider.decrypt_aes_ige(cipher, self._key, self._iv)
 
     def encrypt(self, plain: bytes) -> bytes:
-        padded_plain = plain + self._crypto_provider.secure_random((-len(plain)) % 16)
-        return self._crypto_provider.encrypt_aes_ige(padded_plain, self._key, self._iv)
+        if padding_len := (-len(plain)) % 16:
+            plain = plain + self._crypto_provider.secure_random(padding_len)
+
+        return self._crypto_provider.encrypt_aes_ige(plain, self._key, self._iv)
 
     def encrypt_with_hash(self, plain: bytes) -> bytes:
         return self.encrypt(sha1(plain) + plain)
@@ -59,23 +61,33 @@ class AesIge:
 
 
 class AesIgeAsyncStream:
-    __slots__ = ("_plain_buffer", "_aes", "_in_thread", "_parent")
+    __slots__ = ("_plain_buffer", "_aes", "_in_thread", "_parent", "_plain_consumer")
 
     _plain_buffer: bytearray
     _aes: AesIge
     _in_thread: InThread
     _parent: PartialByteReader
+    _plain_consumer: ByteConsumer | None
 
-    def __init__(self, aes: AesIge, in_thread: InThread, parent: PartialByteReader):
+    def __init__(self, aes: AesIge, in_thread: InThread, parent: PartialByteReader, plain_consumer: ByteConsumer | None = None):
         self._aes = aes
         self._in_thread = in_thread
         self._parent = parent
+        self._plain_consumer = plain_consumer
         self._plain_buffer = bytearray()
 
+    def _decrypt(self, encrypted_buffer: bytes) -> bytes:
+        plain_buffer = self._aes.decrypt(encrypted_buffer)
+
+        if self._plain_consumer is not None:
+            self._plain_consumer(plain_buffer)
+
+        return plain_buffer
+
     async def __call__(self, nbytes: int) -> bytes:
         while len(self._plain_buffer) < nbytes:
             encrypted_buffer = await self._parent()
-            self._plain_buffer += await self._in_thread(lambda: self._aes.decrypt(encrypted_buffer))
+            self._plain_buffer += await self._in_thread(lambda: self._decrypt(encrypted_buffer))
 
         plain = self._plain_buffer[:nbytes]
         del self._plain_buffer[:nbytes]
@@ -13,6 +13,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import hashlib
 import logging
 import secrets
 import time
@@ -24,6 +25,8 @@ __all__ = ("AuthKey", "Key", "AuthKeyUpdatedCallback", "DhGenKey")
 
 AuthKeyUpdatedCallback = typing.Callable[[], typing.Any]
 
+_Sha256Seeds = tuple["hashlib._Hash", "hashlib._Hash"]
+
 
 class AuthKeyUpdatedCallbackHolder:
     __slots__ = ("on_content_change_callback",)
@@ -93,10 +96,12 @@ class KeySession:
 
 
 class DhGenKey:
-    __slots__ = ("auth_key", "auth_key_id", "server_salt", "session", "expire_at")
+    __slots__ = ("auth_key", "auth_key_id", "auth_key_id_bytes", "auth_key_msg_key_sha256_seeds", "server_salt", "session", "expire_at")
 
     auth_key: None | bytes
     auth_key_id: None | int
+    auth_key_id_bytes: None | bytes
+    auth_key_msg_key_sha256_seeds: None | _Sha256Seeds
     server_salt: None | int
     session: KeySession
     expire_at: None | int
@@ -104,6 +109,8 @@ class DhGenKey:
     def __init__(self) -> None:
         self.auth_key = None
         self.auth_key_id = None
+        self.auth_key_id_bytes = None
+        self.auth_key_msg_key_sha256_seeds = None
         self.server_salt = None
         self.expire_at = None
         self.session = KeySession()
@@ -116,11 +123,19 @@ class DhGenKey:
 
         return auth_key, auth_key_id, session
 
+    def get_msg_key_sha256_seeds_or_assert_empty(self) -> _Sha256Seeds:
+        if (auth_key_msg_key_sha256_seeds := self.auth_key_msg_key_sha256_seeds) is None:
+            raise AssertionError("key is empty")
+
+        return auth_key_msg_key_sha256_seeds
+
 
 class Key:
     __slots__ = (
         "auth_key",
         "auth_key_id",
+        "auth_key_id_bytes",
+        "auth_key_msg_key_sha256_seeds",
         "server_salt",
         "session",
         "unused_sessions",
@@ -131,6 +146,8 @@ class Key:
 
     auth_key: None | bytes
     auth_key_id: None | int
+    auth_key_id_bytes: None | bytes
+    auth_key_msg_key_sha256_seeds: None | _Sha256Seeds
     server_salt: None | int
     session: KeySession
     unused_sessions: set[int]
@@ -156,6 +173,8 @@ class Key:
         self.unused_sessions = set()
 
         self.auth_key_id = self.generate_auth_key_id(auth_key)
+        self.auth_key_id_bytes = self.generate_auth_key_id_bytes(auth_key)
+        self.auth_key_msg_key_sha256_seeds = self.generate_auth_key_msg_key_sha256_seeds(auth_key)
 
     def __getstate__(self) -> dict[str, typing.Any]:
         return {
@@ -171,17 +190,27 @@ class Key:
     def __setstate__(self, state: dict[str, typing.Any]) -> None:
         self.auth_key = state["auth_key"]
         self.auth_key_id = state["auth_key_id"]
+        self.auth_key_id_bytes = self.generate_auth_key_id_bytes(self.auth_key)
+        self.auth_key_msg_key_sha256_seeds = self.generate_auth_key_msg_key_sha256_seeds(self.auth_key)
         self.server_salt = state["server_salt"]
         self.session = state["session"]
         self.unused_sessions = state["unused_sessions"]
         self.created_at = state.get("created_at", -1.)
         self.expire_at = state.get("expire_at", None)
 
+    @staticmethod
+    def generate_auth_key_id_bytes(auth_key: bytes | None) -> bytes | None:
+        return sha1(auth_key)[-8:] if auth_key else None
+
     @staticmethod
     def generate_auth_key_id(auth_key: bytes | None) -> int | None:
-        auth_key_id = sha1(auth_key)[-8:] if auth_key else None
+        auth_key_id = Key.generate_auth_key_id_bytes(auth_key)
         return int.from_bytes(auth_key_id, "little", signed=False) if auth_key_id else None
 
+    @staticmethod
+    def generate_auth_key_msg_key_sha256_seeds(auth_key: bytes | None) -> _Sha256Seeds | None:
+        return (hashlib.sha256(auth_key[88:88 + 32]), hashlib.sha256(auth_key[88 + 8:88 + 8 + 32])) if auth_key else None
+
     def flush_changes(self) -> None:
         self._update_callback.on_content_change_callback()
 
@@ -204,6 +233,8 @@ class Key:
 
         self.auth_key = dh_gen_key.auth_key
         self.auth_key_id = dh_gen_key.auth_key_id
+        self.auth_key_id_bytes = dh_gen_key.auth_key_id_bytes
+        self.auth_key_msg_key_sha256_seeds = dh_gen_key.auth_key_msg_key_sha256_seeds
         self.server_salt = dh_gen_key.server_salt
         self.expire_at = dh_gen_key.expire_at
 
@@ -220,6 +251,12 @@ class Key:
 
         return auth_key, auth_key_id, session
 
+    def get_msg_key_sha256_seeds_or_assert_empty(self) -> _Sha256Seeds:
+        if (auth_key_msg_key_sha256_seeds := self.auth_key_msg_key_sha256_seeds) is None:
+            raise AssertionError("key is empty")
+
+        return auth_key_msg_key_sha256_seeds
+
     def is_fresh_key(self) -> bool:
         if (created_at := self.created_at) is not None:
             return (time.time() - created_at) < 60.
@@ -229,6 +266,8 @@ class Key:
     def clear_key(self) -> None:
         self.auth_key = None
         self.auth_key_id = None
+        self.auth_key_id_bytes = None
+        self.auth_key_msg_key_sha256_seeds = None
         self.server_salt = None
         self.session = KeySession()
         self.created_at = -1.
@@ -17,7 +17,7 @@
 import typing
 import secrets
 
-import cryptg  # type: ignore
+import cryptg
 
 from ll_mtproto.crypto.providers.crypto_provider_base import CryptoProviderBase
 
@@ -0,0 +1,36 @@
+# Copyright (C) 2017-2018 (nikat) https://github.com/nikat/mtproto2json
+# Copyright (C) 2020-2024 (andrew) https://github.com/andrew-ld/LL-mtproto
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import typing
+
+try:
+    import gmpy2  # type: ignore
+except ImportError:
+    gmpy2 = None
+
+__all__ = ("powmod",)
+
+
+if gmpy2 is not None:
+    _TYPED_gmpy2_powmod = typing.cast(typing.Callable[[int, int, int], typing.SupportsInt], gmpy2.powmod)
+
+    def powmod(base: int, exp: int, mod: int) -> int:
+        return int(_TYPED_gmpy2_powmod(base, exp, mod))
+
+else:
+    def powmod(base: int, exp: int, mod: int) -> int:
+        return pow(base, exp, mod)
@@ -18,6 +18,8 @@
 import functools
 import random
 
+from ll_mtproto.math.modular import powmod
+
 __all__ = ("is_safe_dh_prime", "miller_rabin")
 
 
@@ -32,7 +34,7 @@ def miller_rabin(num: int, trials: int) -> bool:
 
     for _ in range(trials):
         a = random.randrange(2, num - 1)
-        v = pow(a, s, num)
+        v = powmod(a, s, num)
 
         if v != 1:
             i = 0
@@ -22,10 +22,10 @@ import hmac
 from ll_mtproto.crypto.aes_ige import AesIge
 from ll_mtproto.crypto.auth_key import Key, DhGenKey
 from ll_mtproto.crypto.providers.crypto_provider_base import CryptoProviderBase
-from ll_mtproto.math import primes
+from ll_mtproto.math import primes, modular
 from ll_mtproto.network.datacenter_info import DatacenterInfo
 from ll_mtproto.network.mtproto import MTProto
-from ll_mtproto.tl.byteutils import to_bytes, sha1, xor, SyncByteReaderProxy
+from ll_mtproto.tl.byteutils import to_bytes, sha1, SyncByteReaderProxy
 from ll_mtproto.tl.structure import Structure
 from ll_mtproto.tl.tl import NativeByteReader
 from ll_mtproto.typed import InThread
@@ -107,7 +107,7 @@ class MTProtoKeyCreator:
             temp_key: bool,
             result: asyncio.Future[DhGenKey]
     ) -> "MTProtoKeyCreator":
-        nonce = await in_thread(lambda: crypto_provider.secure_random(16))
+        nonce = crypto_provider.secure_random(16)
         await mtproto.write_unencrypted_message(_cons="req_pq_multi", nonce=nonce)
         return MTProtoKeyCreator(mtproto, in_thread, datacenter, crypto_provider, temp_key, nonce, result)
 
@@ -160,7 +160,8 @@ class MTProtoKeyCreator:
         if not hmac.compare_digest(params3.server_nonce, state.server_nonce):
             raise RuntimeError("Diffie–Hellman exchange failed: server nonce mismatch: `%r`", params3)
 
-        new_nonce_hash1 = (await self._in_thread(lambda: sha1(state.new_nonce + b"\1" + sha1(state.key.auth_key)[0:8])))[4:20]
+        auth_key, _, _ = state.key.get_or_assert_empty()
+        new_nonce_hash1 = sha1(state.new_nonce + b"\1" + sha1(auth_key)[0:8])[4:20]
 
         if not hmac.compare_digest(params3.new_nonce_hash1, new_nonce_hash1):
             raise RuntimeError("Diffie–Hellman exchange failed: new nonce hash1 mismatch: `%r`", params3)
@@ -177,15 +178,12 @@ class MTProtoKeyCreator:
         if not hmac.compare_digest(params.server_nonce, state.server_nonce):
             raise RuntimeError("Diffie–Hellman exchange failed: params server nonce mismatch")
 
-        tmp_aes_key_1, tmp_aes_key_2, tmp_aes_iv_1, tmp_aes_iv_2 = await asyncio.gather(
-            self._in_thread(lambda: sha1(state.new_nonce + state.server_nonce)),
-            self._in_thread(lambda: sha1(state.server_nonce + state.new_nonce)),
-            self._in_thread(lambda: sha1(state.server_nonce + state.new_nonce)),
-            self._in_thread(lambda: sha1(state.new_nonce + state.new_nonce))
-        )
+        new_nonce_server_nonce_sha1 = sha1(state.new_nonce + state.server_nonce)
+        server_nonce_new_nonce_sha1 = sha1(state.server_nonce + state.new_nonce)
+        new_nonce_new_nonce_sha1 = sha1(state.new_nonce + state.new_nonce)
 
-        tmp_aes_key = tmp_aes_key_1 + tmp_aes_key_2[:12]
-        tmp_aes_iv = tmp_aes_iv_1[12:] + tmp_aes_iv_2 + state.new_nonce[:4]
+        tmp_aes_key = new_nonce_server_nonce_sha1 + server_nonce_new_nonce_sha1[:12]
+        tmp_aes_iv = server_nonce_new_nonce_sha1[12:] + new_nonce_new_nonce_sha1 + state.new_nonce[:4]
         tmp_aes = AesIge(tmp_aes_key, tmp_aes_iv, self._crypto_provider)
 
         (answer_hash, answer), b = await asyncio.gather(
@@ -198,7 +196,7 @@ class MTProtoKeyCreator:
         answer_reader_with_hash = SyncByteReaderProxy(answer_reader, answer_reader_sha1.update)
 
         params2 = Structure.from_dict(await self._in_thread(lambda: self._datacenter.schema.read_by_boxed_data(answer_reader_with_hash)))
-        answer_hash_computed = await self._in_thread(answer_reader_sha1.digest)
+        answer_hash_computed = answer_reader_sha1.digest()
 
         if not hmac.compare_digest(answer_hash_computed, answer_hash):
             raise RuntimeError("Diffie–Hellman exchange failed: params2 hash mismatch")
@@ -234,8 +232,8 @@ class MTProtoKeyCreator:
             raise RuntimeError("Diffie–Hellman exchange failed: g_a > dh_prime - (2 ** (2048 - 64))")
 
         g_b, auth_key = await asyncio.gather(
-            self._in_thread(lambda: pow(g, b, dh_prime)),
-            self._in_thread(lambda: pow(g_a, b, dh_prime)),
+            self._in_thread(lambda: modular.powmod(g, b, dh_prime)),
+            self._in_thread(lambda: modular.powmod(g_a, b, dh_prime)),
         )
 
         if g_b <= 1:
@@ -250,7 +248,7 @@ class MTProtoKeyCreator:
         if g_b > dh_prime - (2 ** (2048 - 64)):
             raise RuntimeError("Diffie–Hellman exchange failed: g_b > dh_prime - (2 ** (2048 - 64))")
 
-        server_salt = int.from_bytes(xor(state.new_nonce[:8], state.server_nonce[:8]), "little", signed=True)
+        server_salt = int.from_bytes(state.new_nonce[:8], "little", signed=True) ^ int.from_bytes(state.server_nonce[:8], "little", signed=True)
 
         auth_key_bytes = to_bytes(auth_key)
 
@@ -261,7 +259,9 @@ class MTProtoKeyCreator:
 
         new_auth_key = DhGenKey()
         new_auth_key.auth_key = auth_key_bytes
-        new_auth_key.auth_key_id = await self._in_thread(lambda: Key.generate_auth_key_id(auth_key_bytes))
+        new_auth_key.auth_key_id = Key.generate_auth_key_id(auth_key_bytes)
+        new_auth_key.auth_key_id_bytes = Key.generate_auth_key_id_bytes(auth_key_bytes)
+        new_auth_key.auth_key_msg_key_sha256_seeds = Key.generate_auth_key_msg_key_sha256_seeds(auth_key_bytes)
         new_auth_key.server_salt = server_salt
 
         if self._temp_key:
@@ -304,10 +304,8 @@ class MTProtoKeyCreator:
         server_nonce = res_pq.server_nonce
         pq = int.from_bytes(res_pq.pq, "big", signed=False)
 
-        new_nonce, (p, q) = await asyncio.gather(
-            self._in_thread(lambda: self._crypto_provider.secure_random(32)),
-            self._in_thread(lambda: self._crypto_provider.factorize_pq(pq)),
-        )
+        new_nonce = self._crypto_provider.secure_random(32)
+        p, q = await self._in_thread(lambda: self._crypto_provider.factorize_pq(pq))
 
         p_string = to_bytes(p)
         q_string = to_bytes(q)
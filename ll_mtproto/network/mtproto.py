@@ -16,7 +16,6 @@
 
 
 import asyncio
-import hashlib
 import hmac
 import logging
 
@@ -27,7 +26,7 @@ from ll_mtproto.network.auth_key_not_found_exception import AuthKeyNotFoundExcep
 from ll_mtproto.network.datacenter_info import DatacenterInfo
 from ll_mtproto.network.transport.transport_link_base import TransportLinkBase
 from ll_mtproto.network.transport.transport_link_factory import TransportLinkFactory
-from ll_mtproto.tl.byteutils import sha256, ByteReaderApply, sha1
+from ll_mtproto.tl.byteutils import sha256, sha1
 from ll_mtproto.tl.structure import Structure
 from ll_mtproto.tl.tl import Constructor, TlBodyDataValue, Value, TlBodyData, NativeByteReader
 from ll_mtproto.typed import InThread
@@ -45,7 +44,10 @@ class MTProto:
         "_in_thread",
         "_crypto_provider",
         "_unencrypted_message_constructor",
-        "_message_inner_data_from_server_constructor"
+        "_message_inner_data_constructor",
+        "_message_inner_data_from_server_constructor",
+        "_message_from_client_constructor",
+        "_encrypted_message_constructor"
     )
 
     @staticmethod
@@ -82,7 +84,10 @@ class MTProto:
     _crypto_provider: CryptoProviderBase
 
     _unencrypted_message_constructor: Constructor
+    _message_inner_data_constructor: Constructor
     _message_inner_data_from_server_constructor: Constructor
+    _message_from_client_constructor: Constructor
+    _encrypted_message_constructor: Constructor
 
     def __init__(
             self,
@@ -99,30 +104,25 @@ class MTProto:
         self._in_thread = in_thread
         self._crypto_provider = crypto_provider
 
-        unencrypted_message_constructor = datacenter.schema.constructors.get("unencrypted_message", None)
+        self._unencrypted_message_constructor = self._get_constructor(datacenter, "unencrypted_message")
+        self._message_inner_data_constructor = self._get_constructor(datacenter, "message_inner_data")
+        self._message_inner_data_from_server_constructor = self._get_constructor(datacenter, "message_inner_data_from_server")
+        self._message_from_client_constructor = self._get_constructor(datacenter, "message_from_client")
+        self._encrypted_message_constructor = self._get_constructor(datacenter, "encrypted_message")
 
-        if unencrypted_message_constructor is None:
-            raise TypeError(f"Unable to find unencrypted_message constructor")
-
-        message_inner_data_from_server_constructor = datacenter.schema.constructors.get("message_inner_data_from_server", None)
+    @staticmethod
+    def _get_constructor(datacenter: DatacenterInfo, name: str) -> Constructor:
+        constructor = datacenter.schema.constructors.get(name, None)
 
-        if message_inner_data_from_server_constructor is None:
-            raise TypeError(f"Unable to find message_inner_data_from_server constructor")
+        if constructor is None:
+            raise TypeError(f"Unable to find {name} constructor")
 
-        self._unencrypted_message_constructor = unencrypted_message_constructor
-        self._message_inner_data_from_server_constructor = message_inner_data_from_server_constructor
+        return constructor
 
     def get_next_message_id(self) -> int:
-        message_id = self._datacenter.get_synchronized_time() << 32
-
-        if message_id <= self._last_message_id:
-            message_id = self._last_message_id + 1
-
-        while message_id % 4 != 0:
-            message_id += 1
-
+        # both operands are multiples of 4, so the result is too
+        message_id = max(self._datacenter.get_synchronized_time() << 32, self._last_message_id + 4)
         self._last_message_id = message_id
-
         return message_id
 
     async def read_unencrypted_message(self) -> tuple[Structure, Structure]:
@@ -150,45 +150,50 @@ class MTProto:
             return message, message.body
 
     async def write_unencrypted_message(self, **body: TlBodyDataValue) -> None:
-        message = self._datacenter.schema.bare_kwargs(
-            _cons="unencrypted_message",
+        message = self._unencrypted_message_constructor.serialize(False, dict(
             auth_key_id=0,
             msg_id=self.get_next_message_id(),
             body=self._datacenter.schema.boxed(body),
-        )
+        ))
 
         await self._link.write(message.get_flat_bytes())
 
     async def write_encrypted(self, message: Value, key: Key | DhGenKey) -> None:
         auth_key_key, auth_key_id, session = key.get_or_assert_empty()
+        auth_key_write_sha256_seed, _ = key.get_msg_key_sha256_seeds_or_assert_empty()
 
-        message_inner_data = self._datacenter.schema.bare_kwargs(
-            _cons="message_inner_data",
+        message_inner_data = self._message_inner_data_constructor.serialize(False, dict(
             salt=key.server_salt,
             session_id=session.id,
             message=message,
-        )
+        ))
+
+        padding_len = -(message_inner_data.get_flat_size() + 12) % 16 + 12
+        message_inner_data.append_serialized_tl(self._crypto_provider.secure_random(padding_len))
 
-        message_inner_data_envelope = await self._in_thread(message_inner_data.get_flat_bytes)
+        def _hash_and_encrypt() -> tuple[bytes, bytes]:
+            plain_message = message_inner_data.get_flat_bytes()
 
-        padding = await self._in_thread(lambda: self._crypto_provider.secure_random((-(len(message_inner_data_envelope) + 12) % 16 + 12)))
-        msg_key = (await self._in_thread(lambda: sha256(auth_key_key[88:88 + 32] + message_inner_data_envelope + padding)))[8:24]
-        aes = await self._in_thread(lambda: self.prepare_key_v2(auth_key_key, msg_key, True, self._crypto_provider))
-        encrypted_message = await self._in_thread(lambda: aes.encrypt(message_inner_data_envelope + padding))
+            plain_sha256 = auth_key_write_sha256_seed.copy()
+            plain_sha256.update(plain_message)
+            msg_key = plain_sha256.digest()[8:24]
 
-        full_message = self._datacenter.schema.bare_kwargs(
-            _cons="encrypted_message",
+            aes = self.prepare_key_v2(auth_key_key, msg_key, True, self._crypto_provider)
+            return msg_key, aes.encrypt(plain_message)
+
+        msg_key, encrypted_message = await self._in_thread(_hash_and_encrypt)
+
+        full_message = self._encrypted_message_constructor.serialize(False, dict(
             auth_key_id=auth_key_id,
             msg_key=msg_key,
             encrypted_data=encrypted_message,
-        )
+        ))
 
         await self._link.write(full_message.get_flat_bytes())
 
     async def read_encrypted(self, key: Key | DhGenKey) -> tuple[Structure, Structure]:
-        auth_key_key, auth_key_id, session = key.get_or_assert_empty()
-
-        auth_key_part = auth_key_key[88 + 8:88 + 8 + 32]
+        auth_key_key, _, session = key.get_or_assert_empty()
+        _, auth_key_read_sha256_seed = key.get_msg_key_sha256_seeds_or_assert_empty()
 
         async with self._read_message_lock:
             server_auth_key_id_bytes = await self._link.readn(8)
@@ -199,36 +204,31 @@ class MTProto:
             if server_auth_key_id_bytes == b'S\xfe\xff\xffS\xfe\xff\xff':
                 raise ValueError("Too many requests!")
 
-            server_auth_key_id = int.from_bytes(server_auth_key_id_bytes, "little", signed=False)
-
-            if server_auth_key_id != auth_key_id:
-                raise ValueError("Received a message with unknown auth key id!", server_auth_key_id)
+            if server_auth_key_id_bytes != key.auth_key_id_bytes:
+                raise ValueError("Received a message with unknown auth key id!", int.from_bytes(server_auth_key_id_bytes, "little", signed=False))
 
             msg_key = await self._link.readn(16)
-            msg_aes = await self._in_thread(lambda: self.prepare_key_v2(auth_key_key, msg_key, False, self._crypto_provider))
-            msg_aes_stream = AesIgeAsyncStream(msg_aes, self._in_thread, self._link.read)
+            msg_aes = self.prepare_key_v2(auth_key_key, msg_key, False, self._crypto_provider)
 
-            plain_sha256 = hashlib.sha256()
-            await self._in_thread(lambda: plain_sha256.update(auth_key_part))
-            msg_aes_stream_with_hash = ByteReaderApply(msg_aes_stream, plain_sha256.update, self._in_thread)
+            plain_sha256 = auth_key_read_sha256_seed.copy()
+            msg_aes_stream = AesIgeAsyncStream(msg_aes, self._in_thread, self._link.read, plain_sha256.update)
 
-            message_inner_data_reader = NativeByteReader(await msg_aes_stream_with_hash(8 + 8 + 8 + 4))
+            message_inner_data_reader = NativeByteReader(await msg_aes_stream(8 + 8 + 8 + 4))
 
             try:
                 message = Structure.from_dict(self._message_inner_data_from_server_constructor.deserialize_bare_data(message_inner_data_reader))
             finally:
                 del message_inner_data_reader
 
-            message_body_len = int.from_bytes(await msg_aes_stream_with_hash(4), signed=False, byteorder="little")
-            message_body_envelope = await msg_aes_stream_with_hash(message_body_len)
+            message_body_len = int.from_bytes(await msg_aes_stream(4), signed=False, byteorder="little")
+            message_body_envelope = await msg_aes_stream(message_body_len)
 
             remaining_plain_buffer = msg_aes_stream.remaining_plain_buffer()
 
             if len(remaining_plain_buffer) not in range(12, 1024):
                 raise ValueError("Received a message with wrong padding length!")
 
-            await self._in_thread(lambda: plain_sha256.update(remaining_plain_buffer))
-            msg_key_computed = (await self._in_thread(plain_sha256.digest))[8:24]
+            msg_key_computed = plain_sha256.digest()[8:24]
 
             if not hmac.compare_digest(msg_key, msg_key_computed):
                 raise ValueError("Received a message with unknown msg key!", msg_key, msg_key_computed)
@@ -254,12 +254,11 @@ class MTProto:
     def prepare_message_for_write(self, seq_no: int, body: TlBodyData) -> tuple[Value, int]:
         boxed_message_id = self.get_next_message_id()
 
-        boxed_message = self._datacenter.schema.bare_kwargs(
-            _cons="message_from_client",
+        boxed_message = self._message_from_client_constructor.serialize(False, dict(
             msg_id=boxed_message_id,
             seqno=seq_no,
             body=self._datacenter.schema.boxed(body),
-        )
+        ))
 
         return boxed_message, boxed_message_id
 
@@ -46,6 +46,8 @@ class TransportLinkTcp(TransportLinkBase):
         "_resolver"
     )
 
+    STREAM_READER_LIMIT = 4 * 1024 * 1024
+
     _loop: asyncio.AbstractEventLoop
     _datacenter: DatacenterInfo
     _connect_lock: asyncio.Lock
@@ -79,6 +81,11 @@ class TransportLinkTcp(TransportLinkBase):
         self._transport_codec = None
 
     async def _reconnect_if_needed(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, TransportCodecBase, bytearray]:
+        reader, writer, transport_codec, read_buffer = self._reader, self._writer, self._transport_codec, self._read_buffer
+
+        if reader is not None and writer is not None and transport_codec is not None:
+            return reader, writer, transport_codec, read_buffer
+
         async with self._connect_lock:
             reader, writer, transport_codec, read_buffer = self._reader, self._writer, self._transport_codec, self._read_buffer
 
@@ -118,7 +125,7 @@ class TransportLinkTcp(TransportLinkBase):
 
                 await asyncio.get_running_loop().sock_connect(sock, (address, port))
 
-                reader, writer = await asyncio.open_connection(sock=sock)
+                reader, writer = await asyncio.open_connection(sock=sock, limit=self.STREAM_READER_LIMIT)
                 read_buffer = bytearray()
 
                 self._reader, self._writer, self._transport_codec, self._read_buffer = reader, writer, transport_codec, read_buffer
@@ -143,21 +150,18 @@ class TransportLinkTcp(TransportLinkBase):
         reader, _, codec, read_buffer = await self._reconnect_if_needed()
 
         while len(read_buffer) < n:
-            read_buffer += bytearray(await codec.read_packet(reader))
+            read_buffer += await codec.read_packet(reader)
 
         result = read_buffer[:n]
         del read_buffer[:n]
         return bytes(result)
 
     async def write(self, data: bytes) -> None:
-        data = bytearray(data)
-
         _, writer, codec, _ = await self._reconnect_if_needed()
 
         async with self._write_lock:
-            while (writable_len := min(len(data), 0x7FFFFF)) > 0:
-                await codec.write_packet(writer, data[:writable_len])
-                del data[:writable_len]
+            for offset in range(0, len(data), 0x7FFFFF):
+                await codec.write_packet(writer, data[offset:offset + 0x7FFFFF])
 
     def stop(self) -> None:
         if writer := self._writer:
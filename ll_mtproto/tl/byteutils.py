@@ -36,17 +36,16 @@ __all__ = (
 
 
 def xor(a: bytes, b: bytes) -> bytes:
-    return bytes(ca ^ cb for ca, cb in zip(a, b))
+    length = min(len(a), len(b))
+    return (int.from_bytes(a[:length], "little") ^ int.from_bytes(b[:length], "little")).to_bytes(length, "little")
 
 
-@functools.lru_cache()
 def sha1(b: bytes) -> bytes:
-    return bytes(hashlib.sha1(b).digest())
+    return hashlib.sha1(b).digest()
 
 
-@functools.lru_cache()
 def sha256(b: bytes) -> bytes:
-    return bytes(hashlib.sha256(b).digest())
+    return hashlib.sha256(b).digest()
 
 
 @functools.lru_cache()
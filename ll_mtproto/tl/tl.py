@@ -103,16 +103,14 @@ def _unpack_binary_string(bytereader: SyncByteReader) -> bytes:
     return string
 
 
-def _pack_long_binary_string(data: bytes) -> bytes:
-    return len(data).to_bytes(4, "little", signed=False) + data
+def _pack_long_binary_string_header(data_len: int) -> bytes:
+    return data_len.to_bytes(4, "little", signed=False)
 
 
-def _pack_long_binary_string_padded(data: bytes) -> bytes:
-    padding_len = -len(data) & 15
+def _generate_long_binary_string_padding(data_len: int) -> bytes:
+    padding_len = -data_len & 15
     padding_len += 16 * (secrets.randbits(64) % 16)
-    padding = random.randbytes(padding_len)
-    header = (len(data) + len(padding)).to_bytes(4, "little", signed=False)
-    return header + data + padding
+    return random.randbytes(padding_len)
 
 
 def pack_binary_string(data: bytes) -> bytes:
@@ -617,8 +615,11 @@ class Value:
     def __repr__(self) -> str:
         return f'{"boxed" if self.boxed else "bare"}({self.cons!r})'
 
+    def get_flat_size(self) -> int:
+        return sum([4 if isinstance(k, Flags) else len(k) for k in self.buffers])
+
     def get_flat_bytes(self) -> bytes:
-        return b"".join(map(lambda k: k.get_flat_bytes() if isinstance(k, Flags) else k, self.buffers))
+        return b"".join([k.get_flat_bytes() if isinstance(k, Flags) else k for k in self.buffers])
 
 
 class ParameterFlag:
@@ -808,8 +809,70 @@ class ContinuousFixedSizeBareValuesBatchDeserialization(AbstractSpecializedDeser
         output.update(zip(self._keys, self._unpack_fn(reader(self._size))))
 
 
+class ContinuousFixedSizeBareValuesBatchSerialization:
+    __slots__ = ("_pack_fn", "_keys", "parameters")
+
+    _pack_fn: typing.Final[typing.Callable[..., bytes]]
+    _keys: typing.Final[tuple[str, ...]]
+    parameters: typing.Final[tuple[Parameter, ...]]
+
+    def __init__(self, parameters: list[Parameter]):
+        self._pack_fn = struct.Struct("<" + "".join(map(self._generate_struct_fmt, parameters))).pack
+        self._keys = tuple(p.name for p in parameters)
+        self.parameters = tuple(parameters)
+
+    @staticmethod
+    def _generate_struct_fmt(parameter: Parameter) -> str:
+        match parameter.type:
+            case "int":
+                return "i"
+
+            case "uint":
+                return "I"
+
+            case "long":
+                return "q"
+
+            case "ulong":
+                return "Q"
+
+            case "double":
+                return "d"
+
+            case _:
+                raise TypeError(f"Unsupported optimized serialization {parameter!r}")
+
+    def serialize_bare_data(self, data: "Value", body: "TlBodyData") -> bool:
+        arguments = [body.get(k) for k in self._keys]
+
+        # struct also packs booleans and any __index__ or __float__ object,
+        # leave everything the generic serializer would reject to it
+        for argument in arguments:
+            if isinstance(argument, bool) or not isinstance(argument, (int, float)):
+                return False
+
+        try:
+            data.append_serialized_tl(self._pack_fn(*arguments))
+        except struct.error:
+            return False
+
+        return True
+
+
 _OPTIMIZED_PARAMETERS = tuple[Parameter | AbstractSpecializedDeserialization, ...]
 
+_SERIALIZATION_OPTIMIZED_PARAMETERS = tuple[Parameter | ContinuousFixedSizeBareValuesBatchSerialization, ...]
+
+_batch_serializable_primitives = frozenset(
+    (
+        "int",
+        "uint",
+        "long",
+        "ulong",
+        "double"
+    )
+)
+
 
 class Constructor:
     __slots__ = (
@@ -822,6 +885,7 @@ class Constructor:
         "is_function",
         "ptype_parameter",
         "deserialization_optimized_parameters",
+        "serialization_optimized_parameters",
         "flags_check_table",
         "deserialization_default_dict"
     )
@@ -835,6 +899,7 @@ class Constructor:
     is_function: typing.Final[bool]
     ptype_parameter: typing.Final[Parameter | None]
     deserialization_optimized_parameters: typing.Final[_OPTIMIZED_PARAMETERS]
+    serialization_optimized_parameters: typing.Final[_SERIALIZATION_OPTIMIZED_PARAMETERS]
     flags_check_table: typing.Final[tuple[tuple[int, frozenset[str], int], ...]]
     deserialization_default_dict: typing.Final["TlBodyData"]
 
@@ -858,6 +923,7 @@ class Constructor:
         self.is_function = is_function
         self.ptype_parameter = ptype_parameter
         self.deserialization_optimized_parameters = self._optimize_parameters_for_deserialization(parameters)
+        self.serialization_optimized_parameters = self._optimize_parameters_for_serialization(parameters)
         self.flags_check_table = self._generate_flags_check_table(parameters)
         self.deserialization_default_dict = self._generate_deserialization_default_dict(parameters, name)
 
@@ -931,6 +997,29 @@ class Constructor:
 
         return tuple(output)
 
+    @staticmethod
+    def _optimize_parameters_for_serialization(parameters: tuple[Parameter, ...]) -> _SERIALIZATION_OPTIMIZED_PARAMETERS:
+        sequential_optimizable_params: list[Parameter] = []
+        output: list[Parameter | ContinuousFixedSizeBareValuesBatchSerialization] = []
+
+        def flush_sequential_optimizable_params() -> None:
+            if sequential_optimizable_params:
+                output.append(ContinuousFixedSizeBareValuesBatchSerialization(sequential_optimizable_params))
+
+            sequential_optimizable_params.clear()
+
+        for parameter in parameters:
+            if parameter.type in _batch_serializable_primitives and parameter.parameter_flag is None and not parameter.is_vector:
+                sequential_optimizable_params.append(parameter)
+
+            else:
+                flush_sequential_optimizable_params()
+                output.append(parameter)
+
+        flush_sequential_optimizable_params()
+
+        return tuple(output)
+
     def __repr__(self) -> str:
         return f"{self.name} {''.join(repr(p) for p in self.parameters)}= {self.ptype};"
 
@@ -1003,13 +1092,18 @@ class Constructor:
                 case Value():
                     match parameter.type:
                         case "object":
-                            data.append_serialized_tl(_pack_long_binary_string(argument.get_flat_bytes()))
+                            data.append_serialized_tl(_pack_long_binary_string_header(argument.get_flat_size()))
+                            data.append_serialized_tl(argument)
 
                         case "rawobject":
-                            data.append_serialized_tl(argument.get_flat_bytes())
+                            data.append_serialized_tl(argument)
 
                         case "padded_object":
-                            data.append_serialized_tl(_pack_long_binary_string_padded(argument.get_flat_bytes()))
+                            argument_size = argument.get_flat_size()
+                            padding = _generate_long_binary_string_padding(argument_size)
+                            data.append_serialized_tl(_pack_long_binary_string_header(argument_size + len(padding)))
+                            data.append_serialized_tl(argument)
+                            data.append_serialized_tl(padding)
 
                         case "gzip":
                             data.append_serialized_tl(pack_binary_string(gzip.compress(argument.get_flat_bytes())))
@@ -1058,25 +1152,34 @@ class Constructor:
 
         data = Value(self, boxed=boxed)
 
-        for parameter in self.parameters:
-            if parameter.is_flag:
-                flag_index = parameter.flag_index
+        for parameter in self.serialization_optimized_parameters:
+            if isinstance(parameter, ContinuousFixedSizeBareValuesBatchSerialization):
+                if not parameter.serialize_bare_data(data, body):
+                    # slow path, raises the appropriate error for the invalid argument
+                    for batched_parameter in parameter.parameters:
+                        self._serialize_parameter(data, batched_parameter, body)
+            else:
+                self._serialize_parameter(data, parameter, body)
 
-                if flag_index is None:
-                    raise TypeError(f"Unknown flag index for parameter `{parameter!r}`")
+        return data
 
-                data.append_serializable_flag(flag_index)
+    def _serialize_parameter(self, data: Value, parameter: Parameter, body: "TlBodyData") -> None:
+        if parameter.is_flag:
+            flag_index = parameter.flag_index
 
-            else:
-                argument = body.get(parameter.name)
+            if flag_index is None:
+                raise TypeError(f"Unknown flag index for parameter `{parameter!r}`")
 
-                if argument is None:
-                    if parameter.required:
-                        raise TypeError(f"required `{parameter}` is missing in `{self.name}`")
-                else:
-                    self._serialize_argument(data, parameter, argument)
+            data.append_serializable_flag(flag_index)
 
-        return data
+        else:
+            argument = body.get(parameter.name)
+
+            if argument is None:
+                if parameter.required:
+                    raise TypeError(f"required `{parameter}` is missing in `{self.name}`")
+            else:
+                self._serialize_argument(data, parameter, argument)
 
     def deserialize_boxed_data(self, reader: SyncByteReader) -> "TlBodyData":
         if self.number is None:
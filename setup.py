@@ -1,4 +1,4 @@
 from setuptools import setup
 from mypyc.build import mypycify
 
-setup(ext_modules=mypycify([]))
+setup(ext_modules=mypycify(["ll_mtproto/tl/tl.py"]))